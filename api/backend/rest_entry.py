@@ -1,4 +1,5 @@
 from flask import Flask
+from flask_compress import Compress
 from dotenv import load_dotenv
 import os
 import logging
@@ -47,6 +48,9 @@ def create_app():
     app.logger.info("current_app(): starting the database connection")
     db.init_app(app)
 
+    # Gzip JSON responses for clients that send Accept-Encoding (e.g. saved graph lists)
+    Compress(app)
+
     # Register the routes from each Blueprint with the app object
     # and give a url prefix to each
     app.logger.info("create_app(): registering blueprints with Flask app object.")
@@ -6,70 +6,73 @@ import streamlit as st
 
 
 #### ------------------------ General ------------------------
-def HomeNav():
-    st.sidebar.page_link("Home.py", label="Home", icon="🏠")
-
-
-def AboutPageNav():
-    st.sidebar.page_link("pages/30_About.py", label="About", icon="🧠")
+# Each link is a (page, label, icon) tuple passed to st.sidebar.page_link
+HOME_LINK = ("Home.py", "Home", "🏠")
+ABOUT_LINK = ("pages/30_About.py", "About", "🧠")
+PLAYGROUND_LINK = ("pages/01_Playground.py", "Data Playground", None)
+FEED_LINK = ("pages/00_Feed_Page.py", "My Feed", None)
 
 
 #### ------------------------ Examples for Role of pol_strat_advisor ------------------------
-def PolStratAdvHomeNav():
-    st.sidebar.page_link(
-        "pages/00_Pol_Strat_Home.py", label="Political Strategist Home", icon="👤"
-    )
-
-
-def WorldBankVizNav():
-    st.sidebar.page_link(
-        "pages/01_World_Bank_Viz.py", label="World Bank Visualization", icon="🏦"
-    )
-
-
-def MapDemoNav():
-    st.sidebar.page_link("pages/02_Map_Demo.py", label="Map Demonstration", icon="🗺️")
+POLITICIAN_LINKS = (
+    ("pages/00_Pol_Strat_Home.py", "Political Strategist Home", "👤"),
+    ("pages/01_World_Bank_Viz.py", "World Bank Visualization", "🏦"),
+    ("pages/02_Map_Demo.py", "Map Demonstration", "🗺️"),
+)
 
 
 ## ------------------------ Examples for Role of usaid_worker ------------------------
-def ApiTestNav():
-    st.sidebar.page_link("pages/12_API_Test.py", label="Test the API", icon="🛜")
-
+VOTER_LINKS = (
+    ("pages/11_Prediction.py", "Regression Prediction", "📈"),
+    ("pages/12_API_Test.py", "Test the API", "🛜"),
+    ("pages/13_Classification.py", "Classification Demo", "🌺"),
+    ("pages/14_NGO_Directory.py", "NGO Directory", "📁"),
+    ("pages/15_Add_NGO.py", "Add New NGO", "➕"),
+)
 
-def PredictionNav():
-    st.sidebar.page_link(
-        "pages/11_Prediction.py", label="Regression Prediction", icon="📈"
-    )
 
+#### ------------------------ System Admin Role ------------------------
+ECONOMIST_LINKS = (
+    ("pages/20_Admin_Home.py", "System Admin", "🖥️"),
+    ("pages/21_ML_Model_Mgmt.py", "ML Model Management", "🏢"),
+)
 
-def ClassificationNav():
-    st.sidebar.page_link(
-        "pages/13_Classification.py", label="Classification Demo", icon="🌺"
-    )
 
+# --------------------------------Links Function -----------------------------------------------
+@st.cache_resource(show_spinner=False)
+def _compute_links(roles, show_home):
+    """
+    Return the sidebar links for a tuple of roles. The result only depends on its arguments, so it is cached and shared across pages and reruns.
+    """
+    links = []
+    if show_home:
+        # Show the Home page link (the landing page)
+        links.append(HOME_LINK)
 
-def NgoDirectoryNav():
-    st.sidebar.page_link("pages/14_NGO_Directory.py", label="NGO Directory", icon="📁")
+    # Show World Bank Link and Map Demo Link if the user is a political strategy advisor role.
+    if "Politician" in roles:
+        links.extend(POLITICIAN_LINKS)
 
+    # If the user role is usaid worker, show the Api Testing page
+    if "Voter" in roles:
+        links.extend(VOTER_LINKS)
 
-def AddNgoNav():
-    st.sidebar.page_link("pages/15_Add_NGO.py", label="Add New NGO", icon="➕")
+    # If the user is an administrator, give them access to the administrator pages
+    if "Economist" in roles:
+        links.extend(ECONOMIST_LINKS)
 
+    # Always show the About page at the bottom of the list of links
+    links.append(PLAYGROUND_LINK)
+    links.append(ABOUT_LINK)
+    return tuple(links)
 
-#### ------------------------ System Admin Role ------------------------
-def AdminPageNav():
-    st.sidebar.page_link("pages/20_Admin_Home.py", label="System Admin", icon="🖥️")
-    st.sidebar.page_link(
-        "pages/21_ML_Model_Mgmt.py", label="ML Model Management", icon="🏢"
-    )
 
-def FeedNav():
-    st.sidebar.page_link("pages/00_Feed_Page.py", label="My Feed")
+def _render(links):
+    """Add each (page, label, icon) link to the sidebar."""
+    for page, label, icon in links:
+        st.sidebar.page_link(page, label=label, icon=icon)
 
-def PlaygroundNav():
-    st.sidebar.page_link("pages/01_Playground.py", label="Data Playground")
 
-# --------------------------------Links Function -----------------------------------------------
 def SideBarLinks(show_home=False):
     """
     This function handles adding links to the sidebar of the app based upon the logged-in user's role, which was put in the streamlit session_state object when logging in.
@@ -83,34 +86,9 @@ def SideBarLinks(show_home=False):
         st.session_state.authenticated = False
         st.switch_page("Home.py")
 
-    if show_home:
-        # Show the Home page link (the landing page)
-        HomeNav()
-
     # Show the other page navigators depending on the users' role.
-    if st.session_state["authenticated"]:
-
-        # Show World Bank Link and Map Demo Link if the user is a political strategy advisor role.
-        if "Politician" in st.session_state["Roles"]:
-            PolStratAdvHomeNav()
-            WorldBankVizNav()
-            MapDemoNav()
-
-        # If the user role is usaid worker, show the Api Testing page
-        if "Voter" in st.session_state["Roles"]:
-            PredictionNav()
-            ApiTestNav()
-            ClassificationNav()
-            NgoDirectoryNav()
-            AddNgoNav()
-
-        # If the user is an administrator, give them access to the administrator pages
-        if "Economist" in st.session_state["Roles"]:
-            AdminPageNav()
-
-    # Always show the About page at the bottom of the list of links
-    PlaygroundNav()
-    AboutPageNav()
+    roles = tuple(st.session_state["Roles"]) if st.session_state["authenticated"] else ()
+    _render(_compute_links(roles, show_home))
 
     if st.session_state["authenticated"]:
         # Always show a logout button if there is a logged in user
@@ -1,17 +1,31 @@
 import logging
+import zlib
+from uuid import uuid4
 logger = logging.getLogger(__name__)
 
 import streamlit as st
 import requests
-import plotly.express as px
-import plotly.graph_objects as go
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
-import pandas as pd
 from modules.nav import SideBarLinks
 
 # API Configuration
 API_BASE_URL = "http://web-api:4000"  
 
+# Shared HTTP session so backend calls reuse keep-alive connections.
+# Cached as a resource because Streamlit re-executes this script on every rerun.
+@st.cache_resource(show_spinner=False)
+def _get_session():
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                         max_retries=Retry(total=2, backoff_factor=0.2)))
+    # Ask for compressed responses; requests decodes gzip transparently
+    session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+    return session
+
+_SESSION = _get_session()
+
 # Page setup
 st.set_page_config(layout='wide')
 st.title("Data Playground")
@@ -21,20 +35,31 @@ st.markdown("*Explore how different economic factors affect income inequality.*"
 SideBarLinks()
 
 # API Functions
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def fetch_available_features():
-    """Fetch available feature variables from backend"""
+def _get_json(path):
+    """GET a backend path and return the decoded JSON, or None on failure"""
     try:
-        response = requests.get(f"{API_BASE_URL}/playground/features", timeout=10)
+        response = _SESSION.get(f"{API_BASE_URL}{path}", timeout=10)
         if response.status_code == 200:
-            return response.json().get("features", [])
+            return response.json()
         else:
-            st.error(f"Failed to fetch features: {response.status_code}")
             return None
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error connecting to backend: {str(e)}")
+    except requests.exceptions.RequestException:
         return None
 
+@st.cache_resource(ttl=60, show_spinner=False)  # Cache for 1 minute, shared without copying
+def fetch_saved_graphs(user_id):
+    """Fetch saved graphs for a user.
+    
+    The returned list is shared across reruns, so callers must not mutate it.
+    """
+    saved_json = _get_json(f"/playground/saved/{user_id}")
+    saved_graphs = saved_json.get("saved_graphs", []) if saved_json else []
+    
+    # Format the selectbox labels once per cache fill rather than on every rerun
+    for graph in saved_graphs:
+        graph['_label'] = f"{graph['name']} ({(graph['date_saved'] or 'Unknown')[:10]})"
+    return saved_graphs
+
 def save_graph_to_backend(user_id, graph_name, x_axis, x_min, x_max, x_steps, feature_values):
     """Save graph configuration to backend"""
     try:
@@ -48,51 +73,32 @@ def save_graph_to_backend(user_id, graph_name, x_axis, x_min, x_max, x_steps, fe
             **feature_values  # Spread all feature values
         }
         
-        response = requests.post(f"{API_BASE_URL}/playground/save", json=data, timeout=10)
+        response = _SESSION.post(f"{API_BASE_URL}/playground/save", json=data, timeout=10)
         return response.status_code == 201, response.json()
     except requests.exceptions.RequestException as e:
         return False, {"error": str(e)}
 
-@st.cache_data(ttl=60)  # Cache for 1 minute
-def fetch_saved_graphs(user_id):
-    """Fetch saved graphs for a user"""
-    try:
-        response = requests.get(f"{API_BASE_URL}/playground/saved/{user_id}", timeout=10)
-        if response.status_code == 200:
-            return response.json().get("saved_graphs", [])
-        else:
-            return []
-    except requests.exceptions.RequestException:
-        return []
+# Feature input widgets: (label, backend key, fallback default), laid out four per column.
+# The default's type (int or float) fixes the widget's numeric type.
+FEATURE_SPEC = [
+    ("Population", "Population", 300000000),
+    ("GDP per capita", "GDP_per_capita", 50000.0),
+    ("Trade union density", "Trade_union_density", 10.5),
+    ("Unemployment rate", "Unemployment_rate", 5.2),
+    ("Health", "Health", 8.0),
+    ("Education", "Education", 7.5),
+    ("Housing", "Housing", 6.8),
+    ("Community development", "Community_development", 7.2),
+    ("Productivity", "Productivity", 95.0),
+    ("Real interest rates", "Real_interest_rates", 2.5),
+    ("Corporate tax rate", "Corporate_tax_rate", 21.0),
+    ("Inflation", "Inflation", 2.1),
+    ("Personal/property tax", "Personal_property_tax", 15.0),
+    ("IRLT", "IRLT", 0.0),
+]
 
-def load_graph_from_backend(graph_id):
-    """Load a specific graph configuration"""
-    try:
-        response = requests.get(f"{API_BASE_URL}/playground/graph/{graph_id}", timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
-    except requests.exceptions.RequestException:
-        return None
-
-# Feature variable mapping to match backend expectations
-FEATURE_MAPPING = {
-    "Population": "Population",
-    "GDP per capita": "GDP_per_capita", 
-    "Trade union density": "Trade_union_density",
-    "Unemployment rate": "Unemployment_rate",
-    "Health": "Health",
-    "Education": "Education", 
-    "Housing": "Housing",
-    "Community development": "Community_development",
-    "Productivity": "Productivity",
-    "Real interest rates": "Real_interest_rates",
-    "Corporate tax rate": "Corporate_tax_rate",
-    "Inflation": "Inflation",
-    "Personal/property tax": "Personal_property_tax",
-    "IRLT": "IRLT"
-}
+# Feature variable mapping (display label -> backend name) to match backend expectations
+FEATURE_MAPPING = {label: feature_key for label, feature_key, _ in FEATURE_SPEC}
 
 # Global presets data - hardcoded for simplicity and performance
 PRESETS = {
@@ -146,50 +152,113 @@ PRESETS = {
     }
 }
 
+# Region features aren't exposed as inputs; saved graphs always send these defaults
+_REGION_DEFAULTS = {
+    "Region_East_Asia_and_Pacific": 0,
+    "Region_Europe_and_Central_Asia": 0,
+    "Region_Latin_America_and_Caribbean": 0,
+    "Region_Middle_East_and_North_Africa": 0,
+}
+
+# Lookups derived from the tables above, built once per script run
+_BACKEND_TO_DISPLAY = {v: k for k, v in FEATURE_MAPPING.items()}
+_PRESET_NAMES = tuple(PRESETS.keys())
+# FEATURE_SPEC (via FEATURE_MAPPING) is the source of truth for the selectable features
+_FEATURE_NAMES = tuple(FEATURE_MAPPING)
+
+# GINI trend per unit of the normalized x-axis, keyed by a substring of the feature name.
+# GDP per capita typically has an inverse relationship with inequality, unemployment
+# increases it, and education/health spending reduce it; anything else trends slightly up.
+_FEATURE_SLOPES = {
+    "GDP": -0.15,
+    "capita": -0.15,
+    "Unemployment": 0.12,
+    "Education": -0.10,
+    "Health": -0.10,
+}
+
 # Function to generate fake data for the graph
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=128)  # Pure function of its inputs
 def generate_fake_gini_data(feature_name, x_min, x_max, steps):
     """Generate fake GINI coefficient data for demonstration - REPEATABLE"""
     
     # Create deterministic seed based on input parameters
     # This ensures same inputs always produce same outputs
-    import hashlib
+    # (crc32 rather than hash() so the seed is stable across processes)
     seed_string = f"{feature_name}_{x_min}_{x_max}_{steps}"
-    seed = int(hashlib.md5(seed_string.encode()).hexdigest()[:8], 16) % (2**31)
-    np.random.seed(seed)
+    rng = np.random.default_rng(zlib.crc32(seed_string.encode()))
     
     x_values = np.linspace(x_min, x_max, steps)
     
     # Create realistic-looking fake GINI data based on feature type
     base_gini = 0.35  # Average GINI coefficient
-    noise = np.random.normal(0, 0.02, len(x_values))  # Deterministic noise now
+    noise = rng.normal(0, 0.02, steps)  # Deterministic noise from the local generator
     
-    # Different patterns based on feature type
-    if "GDP" in feature_name or "capita" in feature_name:
-        # GDP per capita typically has inverse relationship with inequality
-        y_values = base_gini - (x_values - x_min) / (x_max - x_min) * 0.15 + noise
-    elif "Unemployment" in feature_name:
-        # Unemployment typically increases inequality
-        y_values = base_gini + (x_values - x_min) / (x_max - x_min) * 0.12 + noise
-    elif "Education" in feature_name or "Health" in feature_name:
-        # Education and health spending typically reduce inequality
-        y_values = base_gini - (x_values - x_min) / (x_max - x_min) * 0.10 + noise
-    else:
-        # Default pattern with slight upward trend
-        y_values = base_gini + (x_values - x_min) / (x_max - x_min) * 0.08 + noise
+    # Trend strength for the feature (first matching keyword wins)
+    slope = next((v for k, v in _FEATURE_SLOPES.items() if k in feature_name), 0.08)
     
-    # Ensure GINI values stay within realistic bounds (0.2 to 0.6)
-    y_values = np.clip(y_values, 0.2, 0.6)
+    # y = base_gini + slope * t + noise, built in place in the t buffer
+    # (t is the position of each x value within [x_min, x_max], evenly spaced from 0 to 1)
+    y_values = np.linspace(0, 1, steps)
+    np.multiply(y_values, slope, out=y_values)
+    np.add(y_values, base_gini, out=y_values)
+    np.add(y_values, noise, out=y_values)
     
-    # Reset random state to avoid affecting other random operations
-    np.random.seed(None)
+    # Ensure GINI values stay within realistic bounds (0.2 to 0.6)
+    np.clip(y_values, 0.2, 0.6, out=y_values)
     
     return x_values, y_values
 
+def build_gini_figure(graph_data):
+    """Build the plotly figure for generated GINI data"""
+    # Imported here so plotly only loads once there is a graph to draw
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=graph_data['x_values'],
+        y=graph_data['y_values'],
+        mode='lines+markers',
+        name='GINI Prediction',
+        line=dict(color='#1f77b4', width=3),
+        marker=dict(size=6)
+    ))
+    
+    fig.update_layout(
+        title=f"GINI Coefficient vs {graph_data['feature_name']}",
+        xaxis_title=graph_data['feature_name'],
+        yaxis_title='GINI Coefficient',
+        template='plotly_white',
+        height=500,
+        hovermode='x unified'
+    )
+    return fig
+
+def set_input_value(widget_key, value):
+    """Set an input widget's value and remember it in _applied_inputs.
+    
+    Streamlit drops widget state when the user leaves the page, so the inputs are
+    re-seeded from _applied_inputs on return. Must run before the widget is rendered
+    in the current script run.
+    """
+    st.session_state[widget_key] = value
+    st.session_state['_applied_inputs'][widget_key] = value
+
+def apply_feature_values(feature_values):
+    """Write feature values straight into the input widgets' session state keys.
+    
+    Must run before the inputs are rendered in the current script run.
+    """
+    for _, feature_key, default in FEATURE_SPEC:
+        if feature_values.get(feature_key) is not None:
+            set_input_value(feature_key.lower(), type(default)(feature_values[feature_key]))
+
 # Initialize session state
 if 'graph_data' not in st.session_state:
     st.session_state.graph_data = None
-if 'available_features' not in st.session_state:
-    st.session_state.available_features = None
+    st.session_state.graph_data_version = None
+if '_applied_inputs' not in st.session_state:
+    st.session_state['_applied_inputs'] = {}
 
 # Check authentication and get user ID
 if not st.session_state.get('authenticated', False):
@@ -207,25 +276,13 @@ if not user_id:
         st.switch_page('Home.py')
     st.stop()
 
-# Fetch available features from backend
-if st.session_state.available_features is None:
-    with st.spinner("Loading available features..."):
-        backend_features = fetch_available_features()
-        if backend_features:
-            # Convert backend feature names to frontend display names
-            display_features = []
-            backend_to_display = {v: k for k, v in FEATURE_MAPPING.items()}
-            
-            for backend_feature in backend_features:
-                display_name = backend_to_display.get(backend_feature, backend_feature)
-                display_features.append(display_name)
-            
-            st.session_state.available_features = display_features
-        else:
-            # Fallback to hardcoded features if backend is unavailable
-            st.session_state.available_features = list(FEATURE_MAPPING.keys())
-            st.warning("⚠️ Backend unavailable - using default features")
-#----------------------^^^^^^^^^^^^^^^^^^^^ Is this fetching of features from the backend necessary?
+# Input widgets read their values from these keys; seed them from the last applied
+# preset/loaded graph, falling back to the hardcoded defaults
+applied_inputs = st.session_state['_applied_inputs']
+input_defaults = {feature_key.lower(): default for _, feature_key, default in FEATURE_SPEC}
+input_defaults.update(compare_feature=_FEATURE_NAMES[0], x_min=0.0, x_max=100.0, steps=20)
+for widget_key, default in input_defaults.items():
+    st.session_state.setdefault(widget_key, applied_inputs.get(widget_key, default))
 
 
 # vvvvvvvvvvvvvvvv Very cool but do we need for rn 
@@ -254,22 +311,24 @@ with st.sidebar:
     saved_graphs = fetch_saved_graphs(user_id)
     
     if saved_graphs:
-        graph_names = [f"{graph['name']} ({graph['date_saved'][:10] if graph['date_saved'] else 'Unknown'})" 
-                      for graph in saved_graphs]
+        graph_names = [graph['_label'] for graph in saved_graphs]
         
         selected_graph = st.selectbox("Load saved graph:", ["None"] + graph_names, key="load_graph_select")
         
         if selected_graph != "None" and st.button("🔄 Load Graph", use_container_width=True):
-            graph_index = graph_names.index(selected_graph)
-            selected_graph_data = saved_graphs[graph_index]
+            # The saved graph list already carries the full configuration, so loading
+            # needs no extra request to /playground/graph/<id>
+            selected_graph_data = {graph['_label']: graph for graph in saved_graphs}[selected_graph]
             
-            # Load graph configuration into session state
-            st.session_state.loaded_graph = selected_graph_data
-            # Clear any selected preset when loading a graph
-            if 'selected_preset' in st.session_state:
-                del st.session_state.selected_preset
+            # Load graph configuration straight into the (not yet rendered) input widgets
+            apply_feature_values(selected_graph_data['features'])
+            loaded_feature = _BACKEND_TO_DISPLAY.get(selected_graph_data.get('x_axis'))
+            if loaded_feature in _FEATURE_NAMES:
+                set_input_value('compare_feature', loaded_feature)
+            set_input_value('x_min', float(selected_graph_data.get('x_min', 0.0)))
+            set_input_value('x_max', float(selected_graph_data.get('x_max', 100.0)))
+            set_input_value('steps', int(selected_graph_data.get('x_steps', 20)))
             st.success(f"Loaded graph: {selected_graph_data['name']}")
-            st.rerun()
     else:
         st.info("No saved graphs found")
 
@@ -278,152 +337,75 @@ if st.session_state.graph_data is not None:
     # Show the generated graph
     st.markdown("### Generated GINI Coefficient Prediction")
     
-    # Create plotly figure
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=st.session_state.graph_data['x_values'],
-        y=st.session_state.graph_data['y_values'],
-        mode='lines+markers',
-        name='GINI Prediction',
-        line=dict(color='#1f77b4', width=3),
-        marker=dict(size=6)
-    ))
-    
-    fig.update_layout(
-        title=f"GINI Coefficient vs {st.session_state.graph_data['feature_name']}",
-        xaxis_title=st.session_state.graph_data['feature_name'],
-        yaxis_title='GINI Coefficient',
-        template='plotly_white',
-        height=500,
-        hovermode='x unified'
-    )
+    # Reuse the stored figure unless the graph data changed since it was built
+    if st.session_state.get('graph_fig_version') != st.session_state.graph_data_version:
+        st.session_state.graph_fig = build_gini_figure(st.session_state.graph_data)
+        st.session_state.graph_fig_version = st.session_state.graph_data_version
+    fig = st.session_state.graph_fig
     
     st.plotly_chart(fig, use_container_width=True)
 else:
     # Show placeholder image when no graph is generated
     st.image("assets/posts/placeholderGraph.gif", caption="GINI vs Population (example)")
 
-# Columns for presets + controls
-col1, col2, col3 = st.columns([0.75, 0.05, 0.2])
+# Presets stay outside the form so applying one still updates the input defaults
+preset_col, _ = st.columns([0.75, 0.25])
 
-with col1:
+with preset_col:
     st.markdown("### Presets:")
     
-    preset_options = ["None"] + list(PRESETS.keys())
+    preset_options = ("None",) + _PRESET_NAMES
     selected_preset = st.selectbox("", preset_options, key="preset_select")
     
     # Apply preset button
     if selected_preset != "None" and st.button("📋 Apply Preset", use_container_width=True):
-        # Store the selected preset data in session state
-        st.session_state.selected_preset = PRESETS[selected_preset]
+        # Write the preset into the input widgets, which are rendered below
+        apply_feature_values(PRESETS[selected_preset])
         st.success(f"Applied preset: {selected_preset}")
-        st.rerun()
 
     st.markdown("")
 
-    # Feature buttons — 4x4 grid to accommodate all features
-    st.markdown("### Feature Variables:")
-    feature_cols = st.columns(4)
+# Inputs are batched in a form so editing them doesn't rerun the page until Generate
+with st.form("params_form"):
+    col1, col2, col3 = st.columns([0.75, 0.05, 0.2])
 
-    # Determine default values (priority: loaded graph > selected preset > hardcoded defaults)
-    loaded_graph = st.session_state.get('loaded_graph', None)
-    selected_preset_data = st.session_state.get('selected_preset', None)
-    
-    def get_default_value(feature_key, fallback_default):
-        """Get default value with priority: loaded graph > preset > fallback"""
-        if loaded_graph and 'features' in loaded_graph:
-            return loaded_graph['features'].get(feature_key, fallback_default)
-        elif selected_preset_data:
-            return selected_preset_data.get(feature_key, fallback_default)
-        else:
-            return fallback_default
-
-    with feature_cols[0]:
-        population = st.number_input("Population:", 
-                                   value=get_default_value('Population', 300000000), 
-                                   key="population")
-        gdp_per_capita = st.number_input("GDP per capita:", 
-                                       value=get_default_value('GDP_per_capita', 50000), 
-                                       key="gdp_per_capita")
-        trade_union = st.number_input("Trade union density:", 
-                                    value=get_default_value('Trade_union_density', 10.5), 
-                                    key="trade_union")
-        unemployment = st.number_input("Unemployment rate:", 
-                                     value=get_default_value('Unemployment_rate', 5.2), 
-                                     key="unemployment")
-
-    with feature_cols[1]:
-        health = st.number_input("Health:", 
-                               value=get_default_value('Health', 8.0), 
-                               key="health")
-        education = st.number_input("Education:", 
-                                  value=get_default_value('Education', 7.5), 
-                                  key="education")
-        housing = st.number_input("Housing:", 
-                                value=get_default_value('Housing', 6.8), 
-                                key="housing")
-        community = st.number_input("Community development:", 
-                                  value=get_default_value('Community_development', 7.2), 
-                                  key="community")
-
-    with feature_cols[2]:
-        productivity = st.number_input("Productivity:", 
-                                     value=get_default_value('Productivity', 95.0), 
-                                     key="productivity")
-        real_interest = st.number_input("Real interest rates:", 
-                                      value=get_default_value('Real_interest_rates', 2.5), 
-                                      key="real_interest")
-        corporate_tax = st.number_input("Corporate tax rate:", 
-                                      value=get_default_value('Corporate_tax_rate', 21), 
-                                      key="corporate_tax")
-        inflation = st.number_input("Inflation:", 
-                                  value=get_default_value('Inflation', 2.1), 
-                                  key="inflation")
-
-    with feature_cols[3]:
-        personal_tax = st.number_input("Personal/property tax:", 
-                                     value=get_default_value('Personal_property_tax', 15), 
-                                     key="personal_tax")
-        irlt = st.number_input("IRLT:", 
-                             value=get_default_value('IRLT', 0.0), 
-                             key="irlt")
-        # Add some spacing for visual balance
-        st.markdown("")
-        st.markdown("")
+    with col1:
+        # Feature buttons — 4x4 grid to accommodate all features
+        st.markdown("### Feature Variables:")
+        feature_cols = st.columns(4)
 
-with col3:
-    st.markdown("### Currently Comparing:")
-    
-    # Use features from backend if available
-    available_features = st.session_state.available_features or list(FEATURE_MAPPING.keys())
-    
-    # Set default compare feature from loaded graph
-    default_compare_feature = None
-    if loaded_graph:
-        backend_feature = loaded_graph.get('x_axis')
-        backend_to_display = {v: k for k, v in FEATURE_MAPPING.items()}
-        default_compare_feature = backend_to_display.get(backend_feature)
-    
-    default_index = 0
-    if default_compare_feature and default_compare_feature in available_features:
-        default_index = available_features.index(default_compare_feature)
-    
-    compare_feature = st.selectbox("Feature", available_features, 
-                                 index=default_index, key="compare_feature")
+        feature_inputs = {}
+        for i, (label, feature_key, default) in enumerate(FEATURE_SPEC):
+            with feature_cols[i // 4]:
+                feature_inputs[feature_key] = st.number_input(f"{label}:", 
+                                                              step=1 if isinstance(default, int) else None, 
+                                                              key=feature_key.lower())
 
-    # Set default values from loaded graph
-    default_x_min = loaded_graph.get('x_min', 0.0) if loaded_graph else 0.0
-    default_x_max = loaded_graph.get('x_max', 100.0) if loaded_graph else 100.0
-    default_steps = loaded_graph.get('x_steps', 20) if loaded_graph else 20
+        with feature_cols[3]:
+            # Add some spacing for visual balance
+            st.markdown("")
+            st.markdown("")
 
-    x_min = st.number_input("Min:", value=float(default_x_min), key="x_min")
-    x_max = st.number_input("Max:", value=float(default_x_max), key="x_max")
-    steps = st.number_input("Steps:", value=int(default_steps), min_value=5, max_value=100, key="steps")
-    
-    st.markdown("")
-    
-    # Generate button
-    if st.button("🚀 Generate Graph", type="primary", use_container_width=True):
+    with col3:
+        st.markdown("### Currently Comparing:")
+        
+        compare_feature = st.selectbox("Feature", _FEATURE_NAMES, 
+                                     key="compare_feature")
+
+        x_min = st.number_input("Min:", key="x_min")
+        x_max = st.number_input("Max:", key="x_max")
+        steps = st.number_input("Steps:", min_value=5, max_value=100, key="steps")
+        
+        st.markdown("")
+        
+        # Generate button
+        generate_clicked = st.form_submit_button("🚀 Generate Graph", type="primary", use_container_width=True)
+
+# Graph actions, aligned under the comparison controls
+_, _, actions_col = st.columns([0.75, 0.05, 0.2])
+
+with actions_col:
+    if generate_clicked:
         if x_min >= x_max:
             st.error("Min value must be less than Max value!")
         elif steps < 5:
@@ -439,6 +421,8 @@ with col3:
                     'y_values': y_values,
                     'feature_name': compare_feature
                 }
+                # New data version so the stored figure gets rebuilt
+                st.session_state.graph_data_version = uuid4().hex
                 
                 st.success("Graph generated successfully!")
                 st.rerun()
@@ -449,28 +433,8 @@ with col3:
         graph_name = st.text_input("Graph name:", placeholder="My Graph", key="graph_name_input")
         
         if st.button("💾 Save Graph", use_container_width=True) and graph_name:
-            # Collect all feature values
-            feature_values = {
-                FEATURE_MAPPING["Population"]: population,
-                FEATURE_MAPPING["GDP_per_capita"]: gdp_per_capita,
-                FEATURE_MAPPING["Trade_union_density"]: trade_union,
-                FEATURE_MAPPING["Unemployment rate"]: unemployment,
-                FEATURE_MAPPING["Health"]: health,
-                FEATURE_MAPPING["Education"]: education,
-                FEATURE_MAPPING["Housing"]: housing,
-                FEATURE_MAPPING["Community development"]: community,
-                FEATURE_MAPPING["Productivity"]: productivity,
-                FEATURE_MAPPING["Real interest rates"]: real_interest,
-                FEATURE_MAPPING["Corporate_tax_rate"]: corporate_tax,
-                FEATURE_MAPPING["Inflation"]: inflation,
-                FEATURE_MAPPING["Personal/property tax"]: personal_tax,
-                FEATURE_MAPPING["IRLT"]: irlt,
-                # Add region features with default values
-                "Region_East_Asia_and_Pacific": 0,
-                "Region_Europe_and_Central_Asia": 0,
-                "Region_Latin_America_and_Caribbean": 0,
-                "Region_Middle_East_and_North_Africa": 0,
-            }
+            # Collect all feature values, with region features at their defaults
+            feature_values = {**feature_inputs, **_REGION_DEFAULTS}
             
             backend_feature_name = FEATURE_MAPPING.get(compare_feature, compare_feature)
             
@@ -485,14 +449,15 @@ with col3:
                 
                 if success:
                     st.success(f"Graph '{graph_name}' saved successfully!")
-                    # Clear the cached saved graphs so they refresh
-                    st.cache_data.clear()
+                    # Clear only the cached saved graphs so they refresh
+                    fetch_saved_graphs.clear()
                 else:
                     st.error(f"Failed to save graph: {response.get('error', 'Unknown error')}")
     
     # Clear button
     if st.button("🗑️ Clear Graph", use_container_width=True):
         st.session_state.graph_data = None
-        if 'loaded_graph' in st.session_state:
-            del st.session_state.loaded_graph
+        st.session_state.graph_data_version = None
+        st.session_state.pop('graph_fig', None)
+        st.session_state.pop('graph_fig_version', None)
         st.rerun()
\ No newline at end of file